@@ -12,14 +12,16 @@ print('-' * 70)
 print(f"{'Level':>5} | {'Total':>5} | {'HSK1':>8} | {'HSK2':>8} | {'HSK3':>8}")
 print('-' * 70)
 
-for tian_level in range(1, 16):
-    level_data = vocab_df[vocab_df['tian_level'] == tian_level]
-    hsk_counts = level_data['hsk_level'].value_counts().sort_index()
-    total = len(level_data)
+# Cross-tabulate tian_level × hsk_level in one pass instead of filtering per level
+xtab = vocab_df.groupby(['tian_level', 'hsk_level']).size().unstack(fill_value=0)
+xtab = xtab.reindex(range(1, 16), fill_value=0)
+
+for tian_level, hsk_counts in xtab.iterrows():
+    total = int(hsk_counts.sum())
     
-    hsk1 = hsk_counts.get(1, 0)
-    hsk2 = hsk_counts.get(2, 0)
-    hsk3 = hsk_counts.get(3, 0)
+    hsk1 = int(hsk_counts.get(1, 0))
+    hsk2 = int(hsk_counts.get(2, 0))
+    hsk3 = int(hsk_counts.get(3, 0))
     
     hsk1_pct = (hsk1/total*100) if total > 0 else 0
     hsk2_pct = (hsk2/total*100) if total > 0 else 0
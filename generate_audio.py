@@ -14,7 +14,6 @@ Audio files are saved in:
 from __future__ import annotations
 
 import argparse
-import io
 import os
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -24,8 +23,8 @@ from typing import Optional
 
 # Windows console UTF-8 setup
 if sys.platform == "win32":
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
 try:
     import pandas as pd
@@ -5,12 +5,11 @@ Generate a CSV report showing how many radicals, hanzi, and vocabulary words are
 
 import pandas as pd
 import sys
-import io
 
 # Windows UTF-8 console support
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 def generate_level_report():
     """Generate a CSV report of counts per level."""
@@ -6,15 +6,14 @@ Creates a multi-bar plot showing how vocabulary is distributed across learning l
 """
 
 import sys
-import io
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 def create_vocab_distribution_plot():
     """Create a multi-bar plot of vocabulary distribution by Tian level and HSK level"""
@@ -6,14 +6,13 @@ Shows distribution and statistics of component productivity scores
 """
 
 import sys
-import io
 import pandas as pd
 from pathlib import Path
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
 
 
 def analyze_hsk_components():
@@ -103,7 +103,7 @@ def analyze_hanzi_scores():
     print("\n🔤 Sample Hanzi by Level:")
     print("-" * 70)
     for level in ['1', '2', '3', '4', '5', '6', '7-9']:
-        if level in df['hsk_level'].values:
+        if level in level_counts.index:
             sample = df[df['hsk_level'] == level]['hanzi'].head(20).tolist()
             sample_str = ''.join(sample)
             print(f"HSK {level:>3}: {sample_str}")
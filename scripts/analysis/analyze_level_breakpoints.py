@@ -14,23 +14,26 @@ Strategy:
 4. Repeat until all radicals assigned
 """
 
+import csv
+import numpy as np
 import pandas as pd
 import sys
-import io
+from collections import defaultdict
 from pathlib import Path
 
-# Windows console UTF-8 setup
-if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-
-
 def load_data():
     """Load radicals and hanzi data"""
     print("📂 Loading data...")
     
-    radicals_df = pd.read_parquet('data/radicals.parquet')
-    hanzi_df = pd.read_parquet('data/hanzi.parquet')
+    # Only read the columns the analysis touches
+    radicals_df = pd.read_parquet(
+        'data/radicals.parquet',
+        columns=['radical', 'meaning', 'usage_count', 'productivity_score'],
+    )
+    hanzi_df = pd.read_parquet(
+        'data/hanzi.parquet',
+        columns=['hanzi', 'components', 'component_count', 'hsk_level'],
+    )
     
     print(f"   ✓ Loaded {len(radicals_df)} radicals")
     print(f"   ✓ Loaded {len(hanzi_df)} hanzi")
@@ -39,26 +42,29 @@ def load_data():
     return radicals_df, hanzi_df
 
 
-def parse_components(components_str):
-    """Parse pipe-separated components string"""
-    if pd.isna(components_str) or not components_str:
-        return []
-    return [c.strip() for c in str(components_str).split('|') if c.strip()]
-
-
-def can_learn_hanzi(hanzi_components, learned_radicals):
-    """Check if all components of a hanzi are in learned radicals"""
-    if not hanzi_components:
-        return False
-    return all(comp in learned_radicals for comp in hanzi_components)
+def unlock_hanzi(posting, remaining_components):
+    """
+    Mark one radical as learned for every hanzi in its posting list.
+    
+    Decrements the missing-component counters in a single vectorized step and
+    returns the indices of hanzi whose counter reached zero (in index order).
+    Unlocked hanzi are flagged with -1 so they are never returned twice.
+    """
+    remaining_components[posting] -= 1
+    unlocked = posting[remaining_components[posting] == 0]
+    remaining_components[unlocked] = -1
+    return unlocked.tolist()
 
 
-def find_breakpoints(radicals_df, hanzi_df, min_hanzi_per_level=20):
+def find_breakpoints(radicals_df, hanzi_df, min_hanzi_per_level=20, verbose=True):
     """
     Find optimal radical grouping to unlock at least min_hanzi_per_level hanzi per level.
     
     Includes 0-component hanzi (which ARE radicals) - they unlock when the radical is introduced.
     
+    Per-level progress lines are buffered and written once after the search
+    (or skipped entirely when verbose=False) to keep I/O out of the hot loop.
+    
     Returns:
         List of tuples: (level_num, radical_indices, num_radicals, newly_unlocked_hanzi)
     """
@@ -68,22 +74,30 @@ def find_breakpoints(radicals_df, hanzi_df, min_hanzi_per_level=20):
     # Sort radicals by weighted productivity_score (HSK1×5 + HSK2×3 + HSK3×1)
     # This prioritizes radicals that appear in HSK1 characters
     radicals_sorted = radicals_df.sort_values('productivity_score', ascending=False).reset_index(drop=True)
+    radicals_list = radicals_sorted['radical'].tolist()
     
     # Parse all hanzi components once, and identify 0-component hanzi
     hanzi_components_list = []
     zero_component_hanzi = {}  # Map radical → hanzi_idx for 0-component hanzi
     
-    for idx, row in hanzi_df.iterrows():
-        hanzi_char = row.get('hanzi', '')
-        component_count = row.get('component_count', 0)
-        components = parse_components(row.get('components', ''))
-        
+    # Split the component strings in one vectorized pass instead of boxing rows with iterrows()
+    components_split = hanzi_df['components'].fillna('').astype(str).str.split('|')
+    component_counts = hanzi_df.get('component_count', pd.Series(0, index=hanzi_df.index))
+    hsk_levels = hanzi_df.get('hsk_level', pd.Series('', index=hanzi_df.index))
+    
+    for idx, (hanzi_char, split, component_count, hsk_level) in enumerate(zip(
+        hanzi_df['hanzi'].to_numpy(),
+        components_split.to_numpy(),
+        component_counts.to_numpy(),
+        hsk_levels.to_numpy(),
+    )):
+        components = [c.strip() for c in split if c.strip()]
         hanzi_data = {
             'hanzi': hanzi_char,
             'components': components,
+            'component_set': frozenset(components),
             'component_count': component_count,
-            'hsk_level': row.get('hsk_level', ''),
-            'learned': False
+            'hsk_level': hsk_level,
         }
         hanzi_components_list.append(hanzi_data)
         
@@ -91,24 +105,44 @@ def find_breakpoints(radicals_df, hanzi_df, min_hanzi_per_level=20):
         if component_count == 0:
             zero_component_hanzi[hanzi_char] = idx
     
+    # Build an inverted index (component → hanzi indices containing it) and a
+    # counter of still-missing components per hanzi. Learning a radical only
+    # touches the hanzi in its posting list; a hanzi unlocks when its counter
+    # reaches zero. Counters of -1 mark hanzi that are already unlocked or that
+    # never unlock through components (0-component and empty-component hanzi).
+    inverted_index = defaultdict(list)
+    remaining_components = np.full(len(hanzi_components_list), -1, dtype=np.int32)
+    for idx, hanzi_data in enumerate(hanzi_components_list):
+        unique_components = hanzi_data['component_set']
+        if hanzi_data['component_count'] == 0 or not unique_components:
+            continue
+        remaining_components[idx] = len(unique_components)
+        for comp in unique_components:
+            inverted_index[comp].append(idx)
+    inverted_index = {
+        comp: np.array(indices, dtype=np.int32) for comp, indices in inverted_index.items()
+    }
+    
     # Track state
     learned_radicals = set()
-    learned_hanzi_indices = set()
     levels = []
+    log_lines = []
     current_level = 1
     radical_start_idx = 0
     
-    while radical_start_idx < len(radicals_sorted):
+    while radical_start_idx < len(radicals_list):
         # Add radicals one by one until we unlock enough hanzi
         newly_unlocked = []
         radicals_in_level = []
         radicals_added_this_iteration = []
         
-        for i in range(radical_start_idx, len(radicals_sorted)):
+        for i in range(radical_start_idx, len(radicals_list)):
             # Add this radical
-            radical = radicals_sorted.iloc[i]['radical']
+            radical = radicals_list[i]
             radicals_in_level.append(i)
             radicals_added_this_iteration.append(radical)
+            # Duplicate radical rows must not decrement the counters twice
+            posting = None if radical in learned_radicals else inverted_index.get(radical)
             learned_radicals.add(radical)
             
             # Count hanzi that would be unlocked at THIS level
@@ -116,26 +150,18 @@ def find_breakpoints(radicals_df, hanzi_df, min_hanzi_per_level=20):
             hanzi_unlocked_this_iteration = []
             
             # FIRST: Check if this radical IS a 0-component hanzi (unlock it immediately)
-            if radical in zero_component_hanzi:
-                hanzi_idx = zero_component_hanzi[radical]
-                if hanzi_idx not in learned_hanzi_indices:
-                    hanzi_unlocked_this_iteration.append(hanzi_idx)
-                    newly_unlocked.append(hanzi_idx)
-                    learned_hanzi_indices.add(hanzi_idx)
+            # (popped so a duplicate radical row cannot unlock it a second time)
+            hanzi_idx = zero_component_hanzi.pop(radical, None)
+            if hanzi_idx is not None:
+                hanzi_unlocked_this_iteration.append(hanzi_idx)
+                newly_unlocked.append(hanzi_idx)
             
-            # SECOND: Check which component-based hanzi can now be learned
-            for idx, hanzi_data in enumerate(hanzi_components_list):
-                if idx in learned_hanzi_indices:
-                    continue  # Already learned
-                
-                # Skip 0-component hanzi (already handled above)
-                if hanzi_data['component_count'] == 0:
-                    continue
-                
-                if can_learn_hanzi(hanzi_data['components'], learned_radicals):
-                    hanzi_unlocked_this_iteration.append(idx)
-                    newly_unlocked.append(idx)
-                    learned_hanzi_indices.add(idx)
+            # SECOND: Decrement counters of component-based hanzi using this radical
+            # (posting lists are in index order, so unlock order matches a full scan)
+            if posting is not None:
+                unlocked = unlock_hanzi(posting, remaining_components)
+                hanzi_unlocked_this_iteration.extend(unlocked)
+                newly_unlocked.extend(unlocked)
             
             # Check if we've unlocked enough hanzi with the radicals added so far
             if len(newly_unlocked) >= min_hanzi_per_level:
@@ -149,15 +175,15 @@ def find_breakpoints(radicals_df, hanzi_df, min_hanzi_per_level=20):
                 })
                 
                 # Show progress
-                radical_names = [radicals_sorted.iloc[ri]['radical'] for ri in radicals_in_level[:5]]
+                radical_names = [radicals_list[ri] for ri in radicals_in_level[:5]]
                 if len(radicals_in_level) > 5:
                     radical_names_str = ', '.join(radical_names) + f', ... ({len(radicals_in_level)} total)'
                 else:
                     radical_names_str = ', '.join(radical_names)
                 
-                print(f"Level {current_level:2d}: {len(radicals_in_level):2d} radicals → {len(newly_unlocked):3d} hanzi")
-                print(f"          Radicals: {radical_names_str}")
-                print()
+                log_lines.append(f"Level {current_level:2d}: {len(radicals_in_level):2d} radicals → {len(newly_unlocked):3d} hanzi")
+                log_lines.append(f"          Radicals: {radical_names_str}")
+                log_lines.append("")
                 
                 current_level += 1
                 radical_start_idx = i + 1
@@ -173,17 +199,20 @@ def find_breakpoints(radicals_df, hanzi_df, min_hanzi_per_level=20):
                     'num_unlocked': len(newly_unlocked)
                 })
                 
-                radical_names = [radicals_sorted.iloc[ri]['radical'] for ri in radicals_in_level[:5]]
+                radical_names = [radicals_list[ri] for ri in radicals_in_level[:5]]
                 if len(radicals_in_level) > 5:
                     radical_names_str = ', '.join(radical_names) + f', ... ({len(radicals_in_level)} total)'
                 else:
                     radical_names_str = ', '.join(radical_names)
                 
-                print(f"Level {current_level:2d}: {len(radicals_in_level):2d} radicals → {len(newly_unlocked):3d} hanzi (final)")
-                print(f"          Radicals: {radical_names_str}")
-                print()
+                log_lines.append(f"Level {current_level:2d}: {len(radicals_in_level):2d} radicals → {len(newly_unlocked):3d} hanzi (final)")
+                log_lines.append(f"          Radicals: {radical_names_str}")
+                log_lines.append("")
             break
     
+    if verbose and log_lines:
+        sys.stdout.write('\n'.join(log_lines) + '\n')
+    
     print("=" * 70)
     print()
     return levels, radicals_sorted, hanzi_components_list
@@ -263,6 +292,10 @@ def show_detailed_breakdown(levels, radicals_sorted, hanzi_components_list, show
     print("=" * 70)
     print()
     
+    radical_arr = radicals_sorted['radical'].to_numpy()
+    meaning_arr = radicals_sorted['meaning'].to_numpy()
+    usage_arr = radicals_sorted['usage_count'].to_numpy()
+    
     for i, level_data in enumerate(levels[:show_first]):
         level = level_data['level']
         radical_indices = level_data['radical_indices']
@@ -273,8 +306,7 @@ def show_detailed_breakdown(levels, radicals_sorted, hanzi_components_list, show
         print(f"  Radicals ({num_radicals}):")
         
         for idx in radical_indices:
-            radical_data = radicals_sorted.iloc[idx]
-            print(f"    {radical_data['radical']:3s} - {radical_data['meaning']:30s} (used in {radical_data['usage_count']} chars)")
+            print(f"    {radical_arr[idx]:3s} - {meaning_arr[idx]:30s} (used in {usage_arr[idx]} chars)")
         
         print(f"  Unlocks {num_unlocked} hanzi")
         print()
@@ -291,23 +323,22 @@ def export_breakpoint_data(levels, radicals_sorted, hanzi_components_list, outpu
     """Export breakpoint analysis to CSV"""
     print(f"💾 Exporting breakpoint analysis to {output_file}...")
     
-    rows = []
-    for level_data in levels:
-        level = level_data['level']
-        radical_indices = level_data['radical_indices']
-        
-        radical_list = [radicals_sorted.iloc[idx]['radical'] for idx in radical_indices]
-        
-        rows.append({
-            'level': level,
-            'num_radicals': level_data['num_radicals'],
-            'radicals': '|'.join(radical_list),
-            'num_unlocked_hanzi': level_data['num_unlocked']
-        })
-    
-    df = pd.DataFrame(rows)
-    df.to_csv(output_file, index=False, encoding='utf-8')
-    print(f"   ✓ Exported {len(df)} levels")
+    radical_arr = radicals_sorted['radical'].to_numpy()
+    
+    # Stream rows straight to disk instead of building an intermediate DataFrame
+    with open(output_file, 'w', newline='', encoding='utf-8') as handle:
+        writer = csv.writer(handle, lineterminator='\n')
+        writer.writerow(['level', 'num_radicals', 'radicals', 'num_unlocked_hanzi'])
+        for level_data in levels:
+            radical_list = [radical_arr[idx] for idx in level_data['radical_indices']]
+            writer.writerow([
+                level_data['level'],
+                level_data['num_radicals'],
+                '|'.join(radical_list),
+                level_data['num_unlocked'],
+            ])
+    
+    print(f"   ✓ Exported {len(levels)} levels")
     print()
 
 
@@ -350,4 +381,10 @@ def main():
 
 
 if __name__ == '__main__':
+    # Windows console UTF-8 setup (only when run as a script, so importing
+    # this module leaves the caller's streams alone)
+    if sys.platform == 'win32':
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+
     main()
@@ -4,33 +4,34 @@ Check total hanzi (0-component + regular) per level
 """
 
 import sys
-import io
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 import pandas as pd
-from collections import Counter
 
 # Read hanzi data
-hanzi_df = pd.read_csv('data/hanzi.csv')
+hanzi_df = pd.read_csv(
+    'data/hanzi.csv',
+    engine='pyarrow',
+    usecols=['hanzi', 'tian_level', 'component_count'],
+    dtype={'tian_level': 'int16', 'component_count': 'int16'},
+)
 
 print("=" * 70)
 print("TOTAL HANZI PER LEVEL")
 print("=" * 70)
 
 # Count total hanzi per level
-level_counts = Counter(hanzi_df['tian_level'])
+level_counts = hanzi_df['tian_level'].value_counts().sort_index()
 
 # Count 0-component hanzi per level
-zero_comp_df = hanzi_df[hanzi_df['component_count'] == 0]
-zero_comp_counts = Counter(zero_comp_df['tian_level'])
+zero_comp_counts = hanzi_df.loc[hanzi_df['component_count'] == 0, 'tian_level'].value_counts()
 
 print("\nLevel | Total | 0-comp | Regular | Status")
 print("-" * 70)
 
-for level in sorted(level_counts.keys()):
-    total = level_counts[level]
+for level, total in level_counts.items():
     zero_comp = zero_comp_counts.get(level, 0)
     regular = total - zero_comp
     
@@ -49,17 +50,17 @@ print("=" * 70)
 print("STATISTICS")
 print("=" * 70)
 print(f"Total levels: {len(level_counts)}")
-print(f"Total hanzi: {sum(level_counts.values())}")
-print(f"Average per level: {sum(level_counts.values()) / len(level_counts):.1f}")
-print(f"Min per level: {min(level_counts.values())} (level {min(level_counts, key=level_counts.get)})")
-print(f"Max per level: {max(level_counts.values())} (level {max(level_counts, key=level_counts.get)})")
+print(f"Total hanzi: {level_counts.sum()}")
+print(f"Average per level: {level_counts.mean():.1f}")
+print(f"Min per level: {level_counts.min()} (level {level_counts.idxmin()})")
+print(f"Max per level: {level_counts.max()} (level {level_counts.idxmax()})")
 print()
 
 # Show problem levels
-problem_levels = [level for level, count in level_counts.items() if count < 15 or count > 30]
-if problem_levels:
+problem_levels = level_counts[(level_counts < 15) | (level_counts > 30)].index
+if len(problem_levels):
     print("⚠️  PROBLEM LEVELS:")
-    for level in sorted(problem_levels):
+    for level in problem_levels:
         total = level_counts[level]
         zero_comp = zero_comp_counts.get(level, 0)
         print(f"   Level {level}: {total} hanzi ({zero_comp} are 0-comp)")
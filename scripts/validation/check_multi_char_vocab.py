@@ -4,33 +4,42 @@ Check multi-character vocabulary words
 """
 
 import sys
-import io
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
+import numpy as np
 import pandas as pd
 
-hanzi_df = pd.read_csv('data/hanzi.csv')
-vocab_df = pd.read_csv('data/vocabulary.csv')
-h2l = dict(zip(hanzi_df['hanzi'], hanzi_df['tian_level']))
+hanzi_df = pd.read_csv(
+    'data/hanzi.csv',
+    engine='pyarrow',
+    usecols=['hanzi', 'tian_level'],
+    dtype={'tian_level': 'int16'},
+)
+vocab_df = pd.read_csv(
+    'data/vocabulary.csv',
+    engine='pyarrow',
+    usecols=['word', 'tian_level'],
+    dtype={'tian_level': 'int16'},
+)
+h2l = hanzi_df.drop_duplicates('hanzi', keep='last').set_index('hanzi')['tian_level']
 
 print('Multi-character vocabulary verification:')
 print('-' * 70)
 
-# Get 2-character words
-two_char = vocab_df[vocab_df['word'].str.len() == 2].head(20)
+# Get 2-character words and look up both character levels in one vectorized pass
+two_char = vocab_df[vocab_df['word'].str.len() == 2].head(20).copy()
+two_char['l0'] = two_char['word'].str[0].map(h2l)
+two_char['l1'] = two_char['word'].str[1].map(h2l)
+two_char = two_char.dropna(subset=['l0', 'l1'])
+two_char['l0'] = two_char['l0'].astype(int)
+two_char['l1'] = two_char['l1'].astype(int)
+two_char['expected'] = np.maximum(two_char['l0'], two_char['l1'])
+two_char['ok'] = two_char['expected'] == two_char['tian_level']
 
-for _, row in two_char.iterrows():
-    word = row['word']
-    vocab_level = row['tian_level']
-    
-    char_levels = []
-    for char in word:
-        if char in h2l:
-            char_levels.append(h2l[char])
-    
-    if len(char_levels) == 2:
-        expected = max(char_levels)
-        status = '✓' if vocab_level == expected else f'❌ (expected {expected})'
-        print(f'{word} (Level {vocab_level:2}) = {word[0]}(L{char_levels[0]:2}) + {word[1]}(L{char_levels[1]:2}) = max({char_levels[0]},{char_levels[1]}) = {expected} {status}')
+for word, vocab_level, l0, l1, expected, ok in two_char[
+    ['word', 'tian_level', 'l0', 'l1', 'expected', 'ok']
+].itertuples(index=False):
+    status = '✓' if ok else f'❌ (expected {expected})'
+    print(f'{word} (Level {vocab_level:2}) = {word[0]}(L{l0:2}) + {word[1]}(L{l1:2}) = max({l0},{l1}) = {expected} {status}')
@@ -2,10 +2,9 @@
 """Check hanzi with zero components"""
 import pandas as pd
 import sys
-import io
 
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 h = pd.read_csv('data/hanzi.csv')
 zero_comp = h[h['component_count'] == 0]
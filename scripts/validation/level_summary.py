@@ -2,18 +2,22 @@
 """Final summary of dynamic level distribution"""
 import pandas as pd
 import sys
-import io
+from concurrent.futures import ThreadPoolExecutor
 
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 print('='*70)
 print('DYNAMIC LEVEL DISTRIBUTION - FINAL SUMMARY')
 print('='*70)
 
-r = pd.read_parquet('data/radicals.parquet')
-h = pd.read_parquet('data/hanzi.parquet')
-v = pd.read_parquet('data/vocabulary.parquet')
+# Only the level column is needed; read the three files concurrently
+# (pyarrow releases the GIL while decoding).
+with ThreadPoolExecutor(max_workers=3) as executor:
+    r, h, v = executor.map(
+        lambda name: pd.read_parquet(f'data/{name}.parquet', columns=['level']),
+        ['radicals', 'hanzi', 'vocabulary'],
+    )
 
 print(f'\nRADICALS: {len(r)} total, levels {int(r.level.min())}-{int(r.level.max())}')
 print(f'   Unique levels: {r.level.nunique()}')
@@ -3,14 +3,13 @@
 
 import sqlite3
 import sys
-import io
 import zipfile
 import tempfile
 import os
 
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 apkg_path = 'anki_deck/HSK_1-3_Hanzi_Deck.apkg'
 
@@ -3,12 +3,11 @@
 
 import pandas as pd
 import sys
-import io
 
 # Windows console UTF-8 setup
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 # Load data
 radicals_df = pd.read_parquet('data/radicals.parquet')
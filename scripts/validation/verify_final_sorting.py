@@ -2,10 +2,9 @@
 """Final verification of sorting order"""
 import pandas as pd
 import sys
-import io
 
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 print('='*70)
 print('✅ FINAL SORTING VERIFICATION')
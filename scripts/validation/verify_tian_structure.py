@@ -2,10 +2,9 @@
 """Quick verification of tian_level structure"""
 import pandas as pd
 import sys
-import io
 
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 r = pd.read_csv('data/radicals.csv')
 h = pd.read_csv('data/hanzi.csv')
@@ -15,12 +15,11 @@ Adapted for HSK 1-3 data structure.
 
 import pandas as pd
 import sys
-import io
 
 # Windows console UTF-8 setup
 if sys.platform == 'win32':
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 # Constants
 RADICALS_PER_LEVEL = 5
@@ -100,7 +99,8 @@ def assign_hanzi_levels(hanzi_df, radical_to_level, radical_levels):
     hanzi_levels = []
     hanzi_to_level = {}
     
-    for idx, row in hanzi_df.iterrows():
+    # Plain dict rows: row.get() is a hash lookup instead of a Series access
+    for row in hanzi_df.to_dict('records'):
         # Use 'components' column (not 'radicals')
         components_str = row.get('components', row.get('radicals', ''))
         radicals_list = parse_radicals_from_hanzi(components_str)
@@ -183,7 +183,7 @@ def assign_vocab_levels(vocab_df, hanzi_to_level, max_hanzi_level):
     
     vocab_levels = []
     
-    for idx, row in vocab_df.iterrows():
+    for row in vocab_df.to_dict('records'):
         # Vocabulary doesn't have 'characters' column in HSK data
         # Just use the word itself to extract characters
         word = row.get('word', '')
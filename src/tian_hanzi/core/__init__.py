@@ -1,7 +1,12 @@
 """Core modules powering the Tian Hanzi deck pipeline."""
 from __future__ import annotations
 
-from .cards import clean_surname_from_definition, create_ruby_text, format_components_with_meanings
+from .cards import (
+    clean_surname_from_definition,
+    create_ruby_text,
+    format_components_with_meanings,
+    radical_meaning_lookup,
+)
 from .deck_pipeline import DeckBuildConfig, DeckBuilder
 from .pinyin import numbered_to_accented
 
@@ -9,6 +14,7 @@ __all__ = [
     "clean_surname_from_definition",
     "create_ruby_text",
     "format_components_with_meanings",
+    "radical_meaning_lookup",
     "DeckBuildConfig",
     "DeckBuilder",
     "numbered_to_accented",
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable
+from typing import Iterable, Mapping
 
 import pandas as pd
 
@@ -10,6 +10,7 @@ __all__ = [
     "clean_surname_from_definition",
     "create_ruby_text",
     "format_components_with_meanings",
+    "radical_meaning_lookup",
 ]
 
 
@@ -87,21 +88,43 @@ def _split_components(value: str | Iterable[str]) -> list[str]:
         return [str(value)] if value else []
 
 
+def radical_meaning_lookup(radicals_df: pd.DataFrame) -> dict[str, str]:
+    """Map each radical to the meaning on its first row in ``radicals_df``."""
+    radicals = radicals_df["radical"].tolist()
+    if "meaning" in radicals_df.columns:
+        meanings = radicals_df["meaning"].tolist()
+    else:
+        meanings = [""] * len(radicals)
+
+    lookup: dict[str, str] = {}
+    for radical, meaning in zip(radicals, meanings):
+        lookup.setdefault(radical, meaning)
+    return lookup
+
+
 def format_components_with_meanings(
-    components: str | Iterable[str], radicals_df: pd.DataFrame
+    components: str | Iterable[str],
+    radicals: pd.DataFrame | Mapping[str, str],
 ) -> str:
-    """Format component strings along with their meanings from ``radicals_df``."""
+    """Format component strings along with their meanings.
+
+    ``radicals`` is either the radicals dataframe or a prebuilt
+    :func:`radical_meaning_lookup`; pass the lookup when formatting many
+    rows so the dataframe is not rescanned for every component.
+    """
     split = _split_components(components)
     if not split:
         return "No components"
 
+    if isinstance(radicals, pd.DataFrame):
+        radicals = radical_meaning_lookup(radicals)
+
     formatted: list[str] = []
     for component in split:
-        match = radicals_df[radicals_df["radical"] == component]
-        if match.empty:
+        if component not in radicals:
             formatted.append(component)
             continue
-        meaning = match.iloc[0].get("meaning", "")
+        meaning = radicals[component]
         if meaning and len(meaning) > 30:
             meaning = meaning[:27] + "..."
         formatted.append(f"{component} ({meaning})" if meaning else component)
@@ -0,0 +1,28 @@
+"""Stable Anki deck IDs for the generated HSK package.
+
+Anki matches decks by ID on import, so these values must never change once a
+deck has been published. Model IDs live on the definitions in
+:mod:`tian_hanzi.core.deck_templates`.
+"""
+from __future__ import annotations
+
+__all__ = [
+    "PARENT_DECK_ID",
+    "RADICAL_DECK_ID",
+    "HANZI_HSK1_DECK_ID",
+    "HANZI_HSK2_DECK_ID",
+    "HANZI_HSK3_DECK_ID",
+    "VOCAB_HSK1_DECK_ID",
+    "VOCAB_HSK2_DECK_ID",
+    "VOCAB_HSK3_DECK_ID",
+]
+
+
+PARENT_DECK_ID = 1421385467
+RADICAL_DECK_ID = 1861728662
+HANZI_HSK1_DECK_ID = 1161232858
+HANZI_HSK2_DECK_ID = 1338215750
+HANZI_HSK3_DECK_ID = 1903202219
+VOCAB_HSK1_DECK_ID = 1941602829
+VOCAB_HSK2_DECK_ID = 1954973887
+VOCAB_HSK3_DECK_ID = 1523538537
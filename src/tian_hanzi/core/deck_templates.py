@@ -1,7 +1,9 @@
 """Shared Anki model templates used for deck generation and previews."""
 from __future__ import annotations
 
+import textwrap
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Sequence, TYPE_CHECKING
 
 __all__ = [
@@ -12,6 +14,7 @@ __all__ = [
     "VOCAB_MODEL_DEF",
     "MODEL_DEFINITIONS",
     "create_genanki_model",
+    "get_genanki_model",
 ]
 
 
@@ -33,13 +36,42 @@ class ModelDefinition:
     """Structure describing an Anki model definition."""
 
     name: str
+    model_id: int
     fields: Sequence[str]
     templates: Sequence[TemplateDefinition]
     css: str
 
 
+def _stylesheet(*parts: str) -> str:
+    """Join CSS fragments and strip the source-code indentation once at import."""
+    return textwrap.dedent("".join(parts)).strip() + "\n"
+
+
+# Layout rules shared by every card type; each model appends its own palette.
+_BASE_CSS = '''
+        .card {
+            font-family: Arial, "Microsoft YaHei", SimSun, sans-serif;
+            text-align: center;
+            padding: 20px;
+        }
+        .card-type {
+            font-size: 14px;
+            font-weight: bold;
+            margin-bottom: 20px;
+            text-transform: uppercase;
+            letter-spacing: 2px;
+        }
+        .meaning {
+            font-size: 32px;
+            font-weight: bold;
+            margin: 20px 0;
+        }
+'''
+
+
 RADICAL_MODEL_DEF = ModelDefinition(
     name="HSK Radical Model",
+    model_id=1333328707,
     fields=(
         "Radical",
         "Meaning",
@@ -79,20 +111,10 @@ RADICAL_MODEL_DEF = ModelDefinition(
             ''',
         ),
     ),
-    css='''
+    css=_stylesheet(_BASE_CSS, '''
         .card {
-            font-family: Arial, "Microsoft YaHei", SimSun, sans-serif;
-            text-align: center;
             color: #4a3728;
             background: linear-gradient(135deg, #f5e6d3 0%, #e8d5c4 100%);
-            padding: 20px;
-        }
-        .card-type {
-            font-size: 14px;
-            font-weight: bold;
-            margin-bottom: 20px;
-            text-transform: uppercase;
-            letter-spacing: 2px;
         }
         .radical-type { color: #8b4513; }
         .character {
@@ -106,11 +128,6 @@ RADICAL_MODEL_DEF = ModelDefinition(
             color: #6b5544;
             margin: 20px 0;
         }
-        .meaning {
-            font-size: 32px;
-            font-weight: bold;
-            margin: 20px 0;
-        }
         .radical-meaning { color: #8b4513; }
         .hsk-stats {
             margin: 25px auto;
@@ -152,12 +169,13 @@ RADICAL_MODEL_DEF = ModelDefinition(
         .hsk3-box {
             background: linear-gradient(135deg, #51cf66 0%, #8ce99a 100%);
         }
-    ''',
+    '''),
 )
 
 
 HANZI_MODEL_DEF = ModelDefinition(
     name="HSK Hanzi Model",
+    model_id=1648347010,
     fields=(
         "Character",
         "Meaning",
@@ -203,20 +221,10 @@ HANZI_MODEL_DEF = ModelDefinition(
             ''',
         ),
     ),
-    css='''
+    css=_stylesheet(_BASE_CSS, '''
         .card {
-            font-family: Arial, "Microsoft YaHei", SimSun, sans-serif;
-            text-align: center;
             color: #2d4a2b;
             background: linear-gradient(135deg, #e8f5e9 0%, #c8e6c9 100%);
-            padding: 20px;
-        }
-        .card-type {
-            font-size: 14px;
-            font-weight: bold;
-            margin-bottom: 20px;
-            text-transform: uppercase;
-            letter-spacing: 2px;
         }
         .hanzi-type { color: #2e7d32; }
         .character {
@@ -230,11 +238,6 @@ HANZI_MODEL_DEF = ModelDefinition(
             color: #4a6741;
             margin: 20px 0;
         }
-        .meaning {
-            font-size: 32px;
-            font-weight: bold;
-            margin: 20px 0;
-        }
         .hanzi-meaning { color: #2e7d32; }
         .character-with-reading {
             margin: 30px 0;
@@ -297,12 +300,13 @@ HANZI_MODEL_DEF = ModelDefinition(
             color: #4a6741;
             text-align: center;
         }
-    ''',
+    '''),
 )
 
 
 VOCAB_MODEL_DEF = ModelDefinition(
     name="HSK Vocabulary Model",
+    model_id=1884424831,
     fields=(
         "Word",
         "Meaning",
@@ -341,20 +345,10 @@ VOCAB_MODEL_DEF = ModelDefinition(
             ''',
         ),
     ),
-    css='''
+    css=_stylesheet(_BASE_CSS, '''
         .card {
-            font-family: Arial, "Microsoft YaHei", SimSun, sans-serif;
-            text-align: center;
             color: #1a237e;
             background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
-            padding: 20px;
-        }
-        .card-type {
-            font-size: 14px;
-            font-weight: bold;
-            margin-bottom: 20px;
-            text-transform: uppercase;
-            letter-spacing: 2px;
         }
         .vocab-type { color: #1565c0; }
         .word {
@@ -368,11 +362,6 @@ VOCAB_MODEL_DEF = ModelDefinition(
             color: #283593;
             margin: 20px 0;
         }
-        .meaning {
-            font-size: 32px;
-            font-weight: bold;
-            margin: 20px 0;
-        }
         .vocab-meaning { color: #1565c0; }
         .word-with-reading {
             margin: 30px 0;
@@ -477,7 +466,7 @@ VOCAB_MODEL_DEF = ModelDefinition(
             line-height: 1.8;
             text-align: left;
         }
-    ''',
+    '''),
 )
 
 
@@ -502,3 +491,14 @@ def create_genanki_model(model_id: int, definition: ModelDefinition) -> "genanki
         ],
         css=definition.css,
     )
+
+
+@lru_cache(maxsize=None)
+def get_genanki_model(kind: str) -> "genanki.Model":
+    """Return the shared ``genanki.Model`` for ``kind`` built with its stable ID.
+
+    Stable IDs let Anki update the existing note types on re-import instead of
+    creating a new copy each time the deck is rebuilt.
+    """
+    definition = MODEL_DEFINITIONS[kind]
+    return create_genanki_model(definition.model_id, definition)
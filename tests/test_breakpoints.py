@@ -0,0 +1,118 @@
+"""Regression tests for the level breakpoint search"""
+import importlib.util
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "analysis" / "analyze_level_breakpoints.py"
+
+
+@pytest.fixture(scope="module")
+def analysis():
+    """Load the analysis script as a module (scripts/ is not a package)"""
+    spec = importlib.util.spec_from_file_location("analyze_level_breakpoints", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def full_scan_breakpoints(radicals_sorted, hanzi_df, min_hanzi_per_level):
+    """Reference search: rescan every hanzi after each radical (the original algorithm)"""
+    hanzi_rows = []
+    zero_component_hanzi = {}
+    for idx, row in hanzi_df.iterrows():
+        components = [c.strip() for c in str(row['components']).split('|') if c.strip()]
+        hanzi_rows.append((components, row['component_count']))
+        if row['component_count'] == 0:
+            zero_component_hanzi[row['hanzi']] = idx
+
+    learned_radicals = set()
+    learned_hanzi = set()
+    levels = []
+    newly_unlocked = []
+    radicals_in_level = []
+    for i, radical in enumerate(radicals_sorted['radical']):
+        radicals_in_level.append(i)
+        learned_radicals.add(radical)
+        hanzi_idx = zero_component_hanzi.get(radical)
+        if hanzi_idx is not None and hanzi_idx not in learned_hanzi:
+            newly_unlocked.append(hanzi_idx)
+            learned_hanzi.add(hanzi_idx)
+        for idx, (components, component_count) in enumerate(hanzi_rows):
+            if idx in learned_hanzi or component_count == 0 or not components:
+                continue
+            if all(comp in learned_radicals for comp in components):
+                newly_unlocked.append(idx)
+                learned_hanzi.add(idx)
+        if len(newly_unlocked) >= min_hanzi_per_level:
+            levels.append((radicals_in_level, newly_unlocked))
+            newly_unlocked = []
+            radicals_in_level = []
+    if radicals_in_level:
+        levels.append((radicals_in_level, newly_unlocked))
+    return levels
+
+
+def run_search(analysis, radicals_df, hanzi_df, min_hanzi_per_level):
+    """Return (levels from find_breakpoints, levels from the reference full scan)"""
+    levels, radicals_sorted, _ = analysis.find_breakpoints(
+        radicals_df, hanzi_df, min_hanzi_per_level=min_hanzi_per_level, verbose=False
+    )
+    actual = [(level['radical_indices'], level['unlocked_hanzi']) for level in levels]
+    assert all(level['num_unlocked'] == len(level['unlocked_hanzi']) for level in levels)
+    return actual, full_scan_breakpoints(radicals_sorted, hanzi_df, min_hanzi_per_level)
+
+
+class TestFindBreakpoints:
+    """Tests for find_breakpoints against the full-scan reference"""
+
+    def test_duplicate_radical_unlocks_zero_component_hanzi_once(self, analysis):
+        """Test a repeated radical row does not unlock its 0-component hanzi twice"""
+        radicals_df = pd.DataFrame({
+            'radical': ['木', '口', '木'],
+            'productivity_score': [3, 2, 1],
+        })
+        hanzi_df = pd.DataFrame({
+            'hanzi': ['木', '口', '杏'],
+            'components': ['', '', '木|口'],
+            'component_count': [0, 0, 2],
+            'hsk_level': [1, 1, 1],
+        })
+
+        actual, expected = run_search(analysis, radicals_df, hanzi_df, min_hanzi_per_level=10)
+
+        assert actual == [([0, 1, 2], [0, 1, 2])]
+        assert actual == expected
+
+    def test_matches_full_scan_on_random_fixtures(self, analysis):
+        """Test level cutoffs match the full scan with duplicate radicals and shared components"""
+        rng = random.Random(0)
+        pool = list('木口日月人女子土水火心手')
+        for _ in range(50):
+            radicals = [rng.choice(pool) for _ in range(15)]
+            radicals_df = pd.DataFrame({
+                'radical': radicals,
+                'productivity_score': rng.sample(range(100), len(radicals)),
+            })
+            hanzi, components, counts = [], [], []
+            for char in rng.sample(pool, 5):
+                hanzi.append(char)
+                components.append('')
+                counts.append(0)
+            for n in range(25):
+                parts = rng.sample(pool, rng.randint(1, 3)) + [rng.choice(pool)]
+                hanzi.append(f'H{n}')
+                components.append('|'.join(parts))
+                counts.append(len(parts))
+            hanzi_df = pd.DataFrame({
+                'hanzi': hanzi,
+                'components': components,
+                'component_count': counts,
+                'hsk_level': 1,
+            })
+
+            actual, expected = run_search(analysis, radicals_df, hanzi_df, min_hanzi_per_level=4)
+
+            assert actual == expected
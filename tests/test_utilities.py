@@ -88,3 +88,20 @@ class TestDataCleaning:
         result, is_surname = clean_surname_from_definition("")
         assert result == ""
         assert is_surname == False
+    
+    def test_format_components_with_meanings(self):
+        """Test component formatting from a dataframe or a prebuilt lookup"""
+        import pandas as pd
+        from tian_hanzi.core.cards import format_components_with_meanings, radical_meaning_lookup
+        
+        radicals_df = pd.DataFrame({
+            'radical': ['木', '口', '木'],
+            'meaning': ['tree', 'mouth and a rather long description', 'wood'],
+        })
+        lookup = radical_meaning_lookup(radicals_df)
+        assert lookup == {'木': 'tree', '口': 'mouth and a rather long description'}
+        
+        expected = "木 (tree), 口 (mouth and a rather long des...), 人"
+        assert format_components_with_meanings("木|口|人", radicals_df) == expected
+        assert format_components_with_meanings("木|口|人", lookup) == expected
+        assert format_components_with_meanings("", lookup) == "No components"